@@ -16,6 +16,7 @@ import sys
 
 PROTECTED = r"(?:main|master|prod|production)"
 PROTECTED_SET = {"main", "master", "prod", "production"}
+PROTECTED_RE = re.compile(PROTECTED)
 # git checkout <branch> or git switch <branch> — but NOT branch-creation flags
 # Handles intervening flags (e.g., --detach, --force) before the protected branch name
 # Excludes: -b, -B, -c, --create (branch creation, not switching)
@@ -30,6 +31,8 @@ PUSH_RE = re.compile(rf"(?:^|[;&|]\s*)git\s+push\b[^;&|]*\b{PROTECTED}(?![\w-])"
 MERGE_RE = re.compile(rf"(?:^|[;&|]\s*)git\s+(?:merge|rebase|reset)\b[^;&|]*\b{PROTECTED}(?![\w-])")
 
 BLOCK_PATTERNS = [CHECKOUT_RE, PUSH_RE, MERGE_RE]
+# Any git write operation, anchored to command start or a shell operator
+GIT_WRITE_RE = re.compile(r"(?:^|[;&|]\s*)git\s+(?:commit|push|merge|rebase|reset)\b")
 
 
 def get_current_branch() -> str | None:
@@ -54,9 +57,7 @@ def is_git_write(command: str) -> bool:
     Anchored to command start or after a shell operator (;, &&, ||, |) to avoid
     false positives from strings like: echo 'git commit'.
     """
-    return bool(
-        re.search(r"(?:^|[;&|]\s*)git\s+(?:commit|push|merge|rebase|reset)\b", command)
-    )
+    return bool(GIT_WRITE_RE.search(command))
 
 
 def main() -> None:
@@ -76,7 +77,7 @@ def main() -> None:
     # Check 1: Block commands that explicitly target protected branches
     for pattern in BLOCK_PATTERNS:
         if pattern.search(command):
-            branch = re.search(PROTECTED, command).group()
+            branch = PROTECTED_RE.search(command).group()
             print(
                 f"BLOCKED: Direct git operation on protected branch '{branch}'.\n"
                 f"Create a feature branch instead:\n"
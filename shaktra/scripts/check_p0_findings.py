@@ -12,26 +12,28 @@ import os
 import sys
 
 
-def find_active_story(yaml) -> dict | None:
+def find_active_story(yaml, loader, handoff_paths: list[str]) -> dict | None:
     """Return the handoff dict for the active story, or None."""
-    project = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-    pattern = os.path.join(project, ".shaktra", "stories", "*", "handoff.yml")
-    candidates = []
-    for path in glob.glob(pattern):
+    by_mtime = []
+    for path in handoff_paths:
         try:
-            with open(path) as f:
-                handoff = yaml.safe_load(f)
-            if not isinstance(handoff, dict):
-                continue
-            phase = handoff.get("current_phase", "")
-            if phase not in ("complete", "failed"):
-                candidates.append((os.path.getmtime(path), path, handoff))
+            by_mtime.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    # Newest first: parsing stops at the first active handoff
+    by_mtime.sort(key=lambda c: c[0], reverse=True)
+    for _, path in by_mtime:
+        try:
+            with open(path, "rb") as f:
+                handoff = yaml.load(f, Loader=loader)
         except Exception:
             continue
-    if not candidates:
-        return None
-    candidates.sort(key=lambda c: c[0], reverse=True)
-    return candidates[0][2]
+        if not isinstance(handoff, dict):
+            continue
+        phase = handoff.get("current_phase", "")
+        if phase not in ("complete", "failed"):
+            return handoff
+    return None
 
 
 def main() -> None:
@@ -41,7 +43,8 @@ def main() -> None:
     # Check if any handoff files exist before importing PyYAML
     project = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
     pattern = os.path.join(project, ".shaktra", "stories", "*", "handoff.yml")
-    if not glob.glob(pattern):
+    handoff_paths = glob.glob(pattern)
+    if not handoff_paths:
         sys.exit(0)
 
     try:
@@ -53,8 +56,9 @@ def main() -> None:
             file=sys.stderr,
         )
         sys.exit(2)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    handoff = find_active_story(yaml)
+    handoff = find_active_story(yaml, loader, handoff_paths)
     if handoff is None:
         sys.exit(0)
 
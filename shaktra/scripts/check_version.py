@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Check for Shaktra plugin updates by comparing local and remote versions."""
 
+import base64
 import json
 import subprocess
 import sys
@@ -52,7 +53,6 @@ def fetch_remote_version(owner: str, repo: str) -> str:
             capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0 and result.stdout.strip():
-            import base64
             decoded = base64.b64decode(result.stdout.strip()).decode()
             data = json.loads(decoded)
             return data.get("version", "")
@@ -77,17 +77,12 @@ def compare_semver(local: str, remote: str) -> str:
         return "up_to_date"
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: check_version.py <plugin_root>", file=sys.stderr)
-        sys.exit(1)
-
-    plugin_root = sys.argv[1]
+def check(plugin_root: str) -> dict:
+    """Return the version check result for the plugin at plugin_root."""
     local_version, repo_url = read_local_version(plugin_root)
 
     if not local_version:
-        print(json.dumps({"error": "plugin.json not found"}))
-        sys.exit(0)
+        return {"error": "plugin.json not found"}
 
     result = {
         "local_version": local_version,
@@ -96,24 +91,29 @@ def main():
 
     if not repo_url:
         result["status"] = "no_repository"
-        print(json.dumps(result))
-        sys.exit(0)
+        return result
 
     owner, repo = parse_github_owner_repo(repo_url)
     if not owner or not repo:
         result["status"] = "invalid_repository"
-        print(json.dumps(result))
-        sys.exit(0)
+        return result
 
     remote_version = fetch_remote_version(owner, repo)
     if not remote_version:
         result["status"] = "offline"
-        print(json.dumps(result))
-        sys.exit(0)
+        return result
 
     result["remote_version"] = remote_version
     result["status"] = compare_semver(local_version, remote_version)
-    print(json.dumps(result))
+    return result
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: check_version.py <plugin_root>", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(check(sys.argv[1])))
 
 
 if __name__ == "__main__":
@@ -11,16 +11,32 @@ except ImportError:
     print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+# libyaml-backed loader/dumper when available — memory stores can hold hundreds of entries
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Chunk output is semantically identical to yaml.Dumper's; line-folding of long
+# quoted scalars may differ, so don't rely on byte-for-byte equality.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-def count_active_entries(memory_dir):
+
+MEMORY_STORES = ("principles.yml", "anti-patterns.yml", "procedures.yml")
+
+
+def load_memory_stores(memory_dir):
+    """Parse each existing memory store once. Returns [(filename, data)]."""
+    stores = []
+    for filename in MEMORY_STORES:
+        try:
+            with open(memory_dir / filename, "rb") as f:
+                stores.append((filename, yaml.load(f, Loader=YAML_LOADER) or {}))
+        except FileNotFoundError:
+            continue
+    return stores
+
+
+def count_active_entries(stores):
     """Count total active entries across all memory stores."""
     total = 0
-    for filename in ("principles.yml", "anti-patterns.yml", "procedures.yml"):
-        path = memory_dir / filename
-        if not path.exists():
-            continue
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+    for _, data in stores:
         # Each file uses its own top-level key
         for key in data:
             entries = data[key]
@@ -36,25 +52,19 @@ def read_settings(settings_path):
         "retrieval_tier2_max": 500,
         "retrieval_chunk_size": 150,
     }
-    if not Path(settings_path).exists():
+    try:
+        with open(settings_path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER) or {}
+    except FileNotFoundError:
         return defaults
-    with open(settings_path) as f:
-        data = yaml.safe_load(f) or {}
     memory = data.get("memory", {})
     return {k: memory.get(k, v) for k, v in defaults.items()}
 
 
-def collect_all_entries(memory_dir):
+def collect_all_entries(stores):
     """Collect all active entries from all memory stores."""
     entries = []
-    for filename, key_hint in [("principles.yml", "principles"),
-                                ("anti-patterns.yml", "anti_patterns"),
-                                ("procedures.yml", "procedures")]:
-        path = memory_dir / filename
-        if not path.exists():
-            continue
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+    for filename, data in stores:
         for key in data:
             items = data[key]
             if isinstance(items, list):
@@ -78,7 +88,8 @@ def write_chunks(story_dir, entries, chunk_size):
         chunk_path = chunks_dir / chunk_filename
 
         with open(chunk_path, "w") as f:
-            yaml.dump({"entries": chunk_entries}, f, default_flow_style=False, sort_keys=False)
+            yaml.dump({"entries": chunk_entries}, f, Dumper=YAML_DUMPER,
+                      default_flow_style=False, sort_keys=False)
 
         chunk_paths.append({
             "path": f".chunks/{chunk_filename}",
@@ -88,7 +99,7 @@ def write_chunks(story_dir, entries, chunk_size):
     # Write manifest
     manifest = {"chunk_count": len(chunk_paths), "chunks": chunk_paths}
     with open(chunks_dir / "manifest.yml", "w") as f:
-        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(manifest, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     return chunk_paths
 
@@ -103,7 +114,8 @@ def main():
     memory_dir = story_dir.parents[1] / "memory"  # .shaktra/stories/<id> → .shaktra/memory
 
     settings = read_settings(settings_path)
-    total = count_active_entries(memory_dir)
+    stores = load_memory_stores(memory_dir)
+    total = count_active_entries(stores)
 
     if total <= settings["retrieval_tier1_max"]:
         tier = 1
@@ -113,7 +125,7 @@ def main():
         chunks = []
     else:
         tier = 3
-        all_entries = collect_all_entries(memory_dir)
+        all_entries = collect_all_entries(stores)
         chunks = write_chunks(story_dir, all_entries, settings["retrieval_chunk_size"])
 
     result = {"tier": tier, "total_entries": total, "chunks": chunks}
@@ -2,12 +2,15 @@
 """Update Shaktra plugin: fetch latest, clear cache, reinstall."""
 
 import json
+import os
 import shutil
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import check_version
+
 PLUGIN_NAME = "shaktra"
 
 
@@ -32,20 +35,27 @@ def find_marketplace(marketplaces_file: Path, mkt_name: str) -> str:
 
 
 def check_for_update(plugin_root: str) -> dict:
-    """Run check_version.py and return parsed result."""
-    script = Path(plugin_root) / "scripts" / "check_version.py"
-    if not script.exists():
-        return {"status": "error", "message": "check_version.py not found"}
+    """Run the check_version.py check in-process; any failure becomes an error status."""
     try:
-        result = subprocess.run(
-            [sys.executable, str(script), plugin_root],
-            capture_output=True, text=True, timeout=15
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as e:
+        return check_version.check(plugin_root)
+    except Exception as e:
         return {"status": "error", "message": str(e)}
-    return {"status": "error", "message": "check_version.py failed"}
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON to a temp file beside path's real target, then rename it into place."""
+    path = path.resolve()  # follow symlinks so the real file is updated, not the link
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w") as f:
+            f.write(json.dumps(data, indent=4) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def git_fetch_reset(mkt_path: str) -> bool:
@@ -170,7 +180,7 @@ def main():
     if "projectPath" in install_entry:
         updated_entry["projectPath"] = install_entry["projectPath"]
     installed_data["plugins"][install_key] = [updated_entry]
-    plugins_file.write_text(json.dumps(installed_data, indent=4) + "\n")
+    write_json_atomic(plugins_file, installed_data)
 
     print(json.dumps({
         "status": "updated",
@@ -99,10 +99,11 @@ def main() -> None:
             file=sys.stderr,
         )
         sys.exit(2)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
     try:
-        with open(file_path) as f:
-            content = yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            content = yaml.load(f, Loader=loader)
     except yaml.YAMLError as e:
         print(f"BLOCKED: Invalid YAML syntax in {rel}\n  {e}")
         sys.exit(2)
@@ -30,13 +30,19 @@ ALWAYS_ALLOWED = (
     "tsconfig.json",
     "requirements.txt",
 )
+# Split once: directory entries match by prefix, file entries by path basename
+ALLOWED_DIRS = tuple(a for a in ALWAYS_ALLOWED if a.endswith("/"))
+ALLOWED_NAMES = frozenset(a for a in ALWAYS_ALLOWED if not a.endswith("/"))
 
 
 def _import_yaml():
-    """Import yaml lazily so operations that don't need it work without PyYAML."""
+    """Import yaml lazily so operations that don't need it work without PyYAML.
+
+    Returns (yaml, loader) — loader is libyaml's CSafeLoader when available.
+    """
     try:
         import yaml
-        return yaml
+        return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     except ImportError:
         print(
             "BLOCKED: PyYAML is required for Shaktra hooks.\n"
@@ -46,26 +52,30 @@ def _import_yaml():
         sys.exit(2)
 
 
-def find_active_story_id(yaml) -> str | None:
+def find_active_story_id(yaml, loader) -> str | None:
     """Return the story_id for the active story, or None."""
     project = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
     pattern = os.path.join(project, ".shaktra", "stories", "*", "handoff.yml")
-    candidates = []
+    by_mtime = []
     for path in glob.glob(pattern):
         try:
-            with open(path) as f:
-                handoff = yaml.safe_load(f)
-            if not isinstance(handoff, dict):
-                continue
-            phase = handoff.get("current_phase", "")
-            if phase not in ("complete", "failed"):
-                candidates.append((os.path.getmtime(path), handoff))
+            by_mtime.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    # Newest first: parsing stops at the first active handoff
+    by_mtime.sort(key=lambda c: c[0], reverse=True)
+    for _, path in by_mtime:
+        try:
+            with open(path, "rb") as f:
+                handoff = yaml.load(f, Loader=loader)
         except Exception:
             continue
-    if not candidates:
-        return None
-    candidates.sort(key=lambda c: c[0], reverse=True)
-    return candidates[0][1].get("story_id")
+        if not isinstance(handoff, dict):
+            continue
+        phase = handoff.get("current_phase", "")
+        if phase not in ("complete", "failed"):
+            return handoff.get("story_id")
+    return None
 
 
 def normalize(file_path: str, project: str) -> str:
@@ -93,23 +103,21 @@ def main() -> None:
     project = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
     rel = normalize(file_path, project)
 
-    for allowed in ALWAYS_ALLOWED:
-        if allowed.endswith("/"):
-            if rel.startswith(allowed) or rel == allowed.rstrip("/"):
-                sys.exit(0)
-        elif rel == allowed or rel.endswith("/" + allowed):
-            sys.exit(0)
+    if rel.startswith(ALLOWED_DIRS) or rel + "/" in ALLOWED_DIRS:
+        sys.exit(0)
+    if rel.rpartition("/")[2] in ALLOWED_NAMES:
+        sys.exit(0)
 
-    yaml = _import_yaml()
+    yaml, loader = _import_yaml()
 
-    story_id = find_active_story_id(yaml)
+    story_id = find_active_story_id(yaml, loader)
     if story_id is None:
         sys.exit(0)
 
     story_path = os.path.join(project, ".shaktra", "stories", f"{story_id}.yml")
     try:
-        with open(story_path) as f:
-            story = yaml.safe_load(f)
+        with open(story_path, "rb") as f:
+            story = yaml.load(f, Loader=loader)
     except Exception as e:
         print(
             f"BLOCKED: Could not read story file '{story_path}'.\n"